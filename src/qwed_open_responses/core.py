@@ -5,10 +5,30 @@ The ResponseVerifier is the main entry point for verifying AI responses.
 It orchestrates multiple guards to ensure responses are safe and correct.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 import json
+import threading
+
+# Shared pool for ResponseVerifier(parallel=True); created on first use
+_POOL: Optional[ThreadPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+_POOL_MAX_WORKERS = 8
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    """Return the process-wide guard pool, creating it lazily."""
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = ThreadPoolExecutor(
+                    max_workers=_POOL_MAX_WORKERS,
+                    thread_name_prefix="qwed-guard",
+                )
+    return _POOL
 
 
 @dataclass
@@ -105,6 +125,7 @@ class ResponseVerifier:
         default_guards: Optional[List["BaseGuard"]] = None,
         strict_mode: bool = True,
         allow_warnings: bool = True,
+        parallel: bool = False,
     ):
         """
         Initialize the verifier.
@@ -113,10 +134,14 @@ class ResponseVerifier:
             default_guards: Guards to use when none specified
             strict_mode: If True, any guard failure blocks response
             allow_warnings: If True, warnings don't block (only errors)
+            parallel: If True, run guards concurrently on a shared thread
+                pool. Useful when guards wait on I/O or release the GIL;
+                guards must not share mutable state.
         """
         self.default_guards = default_guards or []
         self.strict_mode = strict_mode
         self.allow_warnings = allow_warnings
+        self.parallel = parallel
 
     def verify(
         self,
@@ -141,42 +166,141 @@ class ResponseVerifier:
         # Parse response if needed
         parsed_response = self._parse_response(response)
 
-        # Run all guards
+        if self.parallel and len(guards_to_use) > 1:
+            pool = _get_pool()
+            futures = [
+                pool.submit(self._run_guard, guard, parsed_response, context)
+                for guard in guards_to_use
+            ]
+            outcomes = [f.result() for f in futures]
+        else:
+            outcomes = [
+                self._run_guard(guard, parsed_response, context)
+                for guard in guards_to_use
+            ]
+        return self._build_result(parsed_response, outcomes)
+
+    def verify_batch(
+        self,
+        responses: List[Any],
+        guards: Optional[List["BaseGuard"]] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> List[VerificationResult]:
+        """
+        Verify several AI responses, dispatching each guard once per batch.
+
+        Guards that override check_batch() can scan the whole batch in one
+        pass; others fall back to calling check() per response.
+
+        Args:
+            responses: The AI responses to verify
+            guards: Guards to apply (uses default_guards if None)
+            context: Additional context shared by every response
+
+        Returns:
+            One VerificationResult per response, in input order
+        """
+        guards_to_use = guards if guards is not None else self.default_guards
+        context = context or {}
+
+        parsed = [self._parse_response(r) for r in responses]
+        per_response: List[List[Tuple[GuardResult, bool]]] = [[] for _ in parsed]
+
+        for guard in guards_to_use:
+            batch = self._run_guard_batch(guard, parsed, context)
+            for outcomes, outcome in zip(per_response, batch):
+                outcomes.append(outcome)
+
+        return [
+            self._build_result(p, outcomes) for p, outcomes in zip(parsed, per_response)
+        ]
+
+    def _run_guard_batch(
+        self,
+        guard: "BaseGuard",
+        parsed: List[Dict[str, Any]],
+        context: Dict[str, Any],
+    ) -> List[Tuple[GuardResult, bool]]:
+        """Run a guard over a batch; one outcome per response."""
+        # Without an override, per-response calls keep exceptions isolated
+        if type(guard).check_batch is BaseGuard.check_batch:
+            return [self._run_guard(guard, p, context) for p in parsed]
+        try:
+            results = guard.check_batch(parsed, context)
+        except Exception:
+            results = None
+        if results is None or len(results) != len(parsed):
+            # Isolate the failing response(s) by re-running one at a time
+            return [self._run_guard(guard, p, context) for p in parsed]
+        return [self._check_guard_result(guard, r) for r in results]
+
+    def _run_guard(
+        self,
+        guard: "BaseGuard",
+        parsed_response: Dict[str, Any],
+        context: Dict[str, Any],
+    ) -> Tuple[GuardResult, bool]:
+        """Run a single guard; returns its result and whether it raised."""
+        try:
+            result = guard.check(parsed_response, context)
+        except Exception as e:
+            # Guard threw exception - treat as failure
+            return self._guard_error(guard, str(e))
+        return self._check_guard_result(guard, result)
+
+    def _check_guard_result(
+        self, guard: "BaseGuard", result: Any
+    ) -> Tuple[GuardResult, bool]:
+        """Treat anything other than a GuardResult as a guard error."""
+        if isinstance(result, _GUARD_RESULT_TYPES):
+            return result, False
+        return self._guard_error(
+            guard, f"expected GuardResult, got {type(result).__name__}"
+        )
+
+    def _guard_error(self, guard: "BaseGuard", reason: str) -> Tuple[GuardResult, bool]:
+        """Build the failing result recorded for a broken guard."""
+        return (
+            GuardResult(
+                guard_name=guard.name,
+                passed=False,
+                message=f"Guard error: {reason}",
+                severity="error",
+            ),
+            True,
+        )
+
+    def _build_result(
+        self,
+        parsed_response: Dict[str, Any],
+        outcomes: List[Tuple[GuardResult, bool]],
+    ) -> VerificationResult:
+        """Aggregate guard outcomes into a VerificationResult."""
         guard_results: List[GuardResult] = []
         guards_passed = 0
         guards_failed = 0
         blocked = False
         block_reason = None
 
-        for guard in guards_to_use:
-            try:
-                result = guard.check(parsed_response, context)
-                guard_results.append(result)
-
-                if result.passed:
-                    guards_passed += 1
-                else:
-                    guards_failed += 1
-
-                    # Check if this blocks
-                    if result.severity == "error" or (
-                        result.severity == "warning" and not self.allow_warnings
-                    ):
-                        if self.strict_mode:
-                            blocked = True
-                            block_reason = result.message
-
-            except Exception as e:
-                # Guard threw exception - treat as failure
-                guard_results.append(
-                    GuardResult(
-                        guard_name=guard.name,
-                        passed=False,
-                        message=f"Guard error: {str(e)}",
-                        severity="error",
-                    )
-                )
-                guards_failed += 1
+        for result, raised in outcomes:
+            guard_results.append(result)
+            if result.passed:
+                guards_passed += 1
+                continue
+
+            guards_failed += 1
+
+            # Guard exceptions count as failures but do not block
+            if raised:
+                continue
+
+            # Check if this blocks
+            if result.severity == "error" or (
+                result.severity == "warning" and not self.allow_warnings
+            ):
+                if self.strict_mode:
+                    blocked = True
+                    block_reason = result.message
 
         # Determine overall verification status
         verified = guards_failed == 0
@@ -270,3 +394,7 @@ class ResponseVerifier:
 
 # Import guards for type hints
 from .guards.base import BaseGuard
+from .guards.base import GuardResult as _BaseGuardResult
+
+# Guards may return either GuardResult class
+_GUARD_RESULT_TYPES = (GuardResult, _BaseGuardResult)
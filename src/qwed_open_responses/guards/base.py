@@ -3,7 +3,7 @@ Base Guard - Abstract base class for all guards.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
 
 
@@ -65,6 +65,26 @@ class BaseGuard(ABC):
         """
         pass
 
+    def check_batch(
+        self,
+        responses: List[Dict[str, Any]],
+        context: Optional[Dict[str, Any]] = None,
+    ) -> List[GuardResult]:
+        """
+        Check several responses at once.
+
+        Override when a guard can process the whole batch more cheaply than
+        one response at a time. The default calls check() per response.
+
+        Args:
+            responses: The parsed AI responses
+            context: Additional context shared by every response
+
+        Returns:
+            One GuardResult per response, in input order
+        """
+        return [self.check(response, context) for response in responses]
+
     def pass_result(
         self,
         message: Optional[str] = None,
@@ -4,6 +4,23 @@ from typing import Any, Dict
 from .base import BaseGuard, GuardResult
 
 NPV_VERIFICATION_FAILED = "NPV verification failed"
+# qwed-finance rounds its NPV to cents (half-up) and then allows 0.01, so a
+# local pass must stay within 0.01 - 0.005 (rounding) - 0.001 (float error)
+NPV_FAST_PATH_TOLERANCE = 0.004
+# Bounds under which float error in _npv stays below 0.001
+_FAST_PATH_MAX_MAGNITUDE = 1e9
+_FAST_PATH_MAX_TERMS = 1000
+
+
+def _npv(cashflows: Any, rate: float) -> float:
+    """Discount cashflows (t=0 undiscounted) without per-term exponentiation."""
+    acc = 0.0
+    factor = 1.0
+    inv = 1.0 / (1.0 + rate)
+    for cf in cashflows:
+        acc += cf * factor
+        factor *= inv
+    return acc
 
 
 class FinanceGuard(BaseGuard):
@@ -60,6 +77,21 @@ class FinanceGuard(BaseGuard):
             return f"{NPV_VERIFICATION_FAILED} ({'; '.join(parts)})"
         return NPV_VERIFICATION_FAILED
 
+    def _npv_fast_path_agrees(self, cashflows: Any, rate: float, npv: Any) -> bool:
+        """True only when the engine is certain to accept the claimed NPV."""
+        # Negative rates grow the discount factor and break the error bound
+        if not isinstance(npv, (int, float)) or rate < 0:
+            return False
+        if len(cashflows) > _FAST_PATH_MAX_TERMS:
+            return False
+        try:
+            if not sum(abs(cf) for cf in cashflows) <= _FAST_PATH_MAX_MAGNITUDE:
+                return False
+            return abs(_npv(cashflows, rate) - npv) <= NPV_FAST_PATH_TOLERANCE
+        except OverflowError:
+            # Leave huge values to the engine's Decimal arithmetic
+            return False
+
     def _verify_npv(self, content: Dict[str, Any]) -> GuardResult:
         cashflows = content["cashflows"]
         npv = content["npv"]
@@ -77,6 +109,8 @@ class FinanceGuard(BaseGuard):
             return self.fail_result("Invalid 'npv': value must not be null")
         raw_rate = content.get("discount_rate")
         rate = raw_rate if isinstance(raw_rate, (int, float)) else 0.0
+        if self._npv_fast_path_agrees(cashflows, rate, npv):
+            return self.pass_result()
         result = self.math_engine.verify_npv(
             cashflows=cashflows,
             rate=rate,
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from typing import Any, Dict, List
 from .base import BaseGuard, GuardResult
+import hashlib
+import json
+import threading
 
 _US_STATE_ABBREVIATIONS = frozenset(
     {
@@ -120,6 +124,10 @@ _US_STATE_NAMES = frozenset(
     }
 )
 
+_CA_JURISDICTIONS = frozenset({"CA", "CALIFORNIA"})
+
+_REQUIRED_CLAUSES = ("termination", "governing_law", "force_majeure")
+
 JURISDICTION_MISMATCH = "Jurisdiction Mismatch"
 
 
@@ -138,8 +146,20 @@ class LegalGuard(BaseGuard):
     name = "LegalGuard"
     description = "Verifies AI-generated contract analysis against legal rules"
 
-    def __init__(self):
+    def __init__(self, cache_size: int = 512):
+        """
+        Initialize LegalGuard.
+
+        Args:
+            cache_size: Number of contract verdicts to memoize, keyed on a
+                SHA-256 digest of the canonical contract JSON (0 disables)
+        """
         super().__init__()
+        self.cache_size = cache_size
+        self._review_cache: OrderedDict[bytes, tuple[list[str], list[str]]] = (
+            OrderedDict()
+        )
+        self._review_cache_lock = threading.Lock()
         try:
             from qwed_legal.guards.jurisdiction_guard import JurisdictionGuard
             from qwed_legal.guards.clause_guard import ClauseGuard
@@ -166,10 +186,10 @@ class LegalGuard(BaseGuard):
 
     def _check_jurisdiction(
         self, contract_data: Dict[str, Any]
-    ) -> tuple[str | None, list[str]]:
+    ) -> tuple[str | None, list[str], bool]:
         warnings: list[str] = []
         if "governing_law" not in contract_data or "forum" not in contract_data:
-            return None, warnings
+            return None, warnings, False
         parties_raw = contract_data.get("parties_countries")
         if not isinstance(parties_raw, (list, tuple)):
             parties_raw = [_normalize_country(contract_data.get("jurisdiction", ""))]
@@ -178,7 +198,7 @@ class LegalGuard(BaseGuard):
             warnings.append(
                 "Jurisdiction check skipped (missing party country information)"
             )
-            return None, warnings
+            return None, warnings, False
         try:
             j_check = self.jurisdiction_engine.verify_choice_of_law(
                 parties_countries=parties,
@@ -187,43 +207,46 @@ class LegalGuard(BaseGuard):
             )
         except Exception:
             warnings.append("Jurisdiction check skipped: internal error (API mismatch)")
-            return None, warnings
+            return None, warnings, True
         if isinstance(j_check, dict):
             if not j_check.get("verified", True):
-                return j_check.get("risk", JURISDICTION_MISMATCH), warnings
-            return None, warnings
+                return j_check.get("risk", JURISDICTION_MISMATCH), warnings, False
+            return None, warnings, False
         if hasattr(j_check, "conflicts"):
             j_warnings = getattr(j_check, "warnings", [])
             if isinstance(j_warnings, list):
                 warnings.extend(j_warnings)
             if j_check.conflicts:
-                return getattr(j_check, "message", JURISDICTION_MISMATCH), warnings
-            return None, warnings
+                return (
+                    getattr(j_check, "message", JURISDICTION_MISMATCH),
+                    warnings,
+                    False,
+                )
+            return None, warnings, False
         if not getattr(j_check, "verified", True):
-            return JURISDICTION_MISMATCH, warnings
-        return None, warnings
+            return JURISDICTION_MISMATCH, warnings, False
+        return None, warnings, False
 
-    def _check_prohibited_clauses(
+    def _check_clauses(
         self, clauses: List[Dict[str, Any]], jurisdiction: str
-    ) -> List[str]:
-        flags = []
+    ) -> tuple[list[str], list[str]]:
+        flags: list[str] = []
+        present: set[str] = set()
+        is_ca = jurisdiction in _CA_JURISDICTIONS
         for clause in clauses:
             if not isinstance(clause, dict):
                 continue
             c_type = clause.get("type", "")
-            if c_type == "non_compete" and jurisdiction in ("CA", "CALIFORNIA"):
+            if isinstance(c_type, str):
+                present.add(c_type)
+            if is_ca and c_type == "non_compete":
                 flags.append(
                     "PROHIBITED_CLAUSE: Non-compete clauses are unenforceable in California."
                 )
-        return flags
-
-    def _check_missing_clauses(self, clauses: List[Dict[str, Any]]) -> List[str]:
-        required_clauses = ["termination", "governing_law", "force_majeure"]
-        present_types = [c.get("type") for c in clauses if isinstance(c, dict)]
-        missing = [req for req in required_clauses if req not in present_types]
+        missing = [req for req in _REQUIRED_CLAUSES if req not in present]
         if missing:
-            return [f"COMPLETENESS_WARNING: Missing standard clauses: {missing}"]
-        return []
+            return flags, [f"COMPLETENESS_WARNING: Missing standard clauses: {missing}"]
+        return flags, []
 
     def _check_nda_terms(self, contract_data: Dict[str, Any]) -> str | None:
         term_years = contract_data.get("term_years")
@@ -243,10 +266,58 @@ class LegalGuard(BaseGuard):
         contract_data: Dict[str, Any],
         _context: dict[str, Any] | None = None,
     ) -> GuardResult:
-        hard_flags = []
-        warnings_list = []
+        hard_flags, warnings_list = self._cached_review(contract_data)
+
+        if hard_flags:
+            details: Dict[str, Any] = {"flags": list(hard_flags)}
+            if warnings_list:
+                details["warnings"] = list(warnings_list)
+            return self.fail_result("; ".join(hard_flags), details=details)
+
+        if warnings_list:
+            return self.warn_result(
+                "; ".join(warnings_list), details={"warnings": list(warnings_list)}
+            )
+
+        return self.pass_result()
 
-        j_flag, j_warnings = self._check_jurisdiction(contract_data)
+    def _cached_review(
+        self, contract_data: Dict[str, Any]
+    ) -> tuple[list[str], list[str]]:
+        if self.cache_size <= 0:
+            return self._review(contract_data)[:2]
+        # No default=: objects with equal str() must not share a key, since
+        # the engines receive the original values
+        try:
+            canonical = json.dumps(contract_data, sort_keys=True)
+        except (TypeError, ValueError):
+            return self._review(contract_data)[:2]
+        # Fixed-size key so cached entries don't retain whole contracts
+        key = hashlib.sha256(canonical.encode()).digest()
+
+        with self._review_cache_lock:
+            cached = self._review_cache.get(key)
+            if cached is not None:
+                self._review_cache.move_to_end(key)
+                return cached
+
+        hard_flags, warnings_list, engine_failed = self._review(contract_data)
+        review = (hard_flags, warnings_list)
+        # A failed engine call is transient; don't pin its fallback warning
+        if not engine_failed:
+            with self._review_cache_lock:
+                self._review_cache[key] = review
+                while len(self._review_cache) > self.cache_size:
+                    self._review_cache.popitem(last=False)
+        return review
+
+    def _review(
+        self, contract_data: Dict[str, Any]
+    ) -> tuple[list[str], list[str], bool]:
+        hard_flags: list[str] = []
+        warnings_list: list[str] = []
+
+        j_flag, j_warnings, engine_failed = self._check_jurisdiction(contract_data)
         if j_flag:
             hard_flags.append(j_flag)
         warnings_list.extend(j_warnings)
@@ -255,22 +326,12 @@ class LegalGuard(BaseGuard):
         jurisdiction = j_val.strip().upper() if isinstance(j_val, str) else ""
         clauses = contract_data.get("clauses") or []
 
-        hard_flags.extend(self._check_prohibited_clauses(clauses, jurisdiction))
-        warnings_list.extend(self._check_missing_clauses(clauses))
+        clause_flags, clause_warnings = self._check_clauses(clauses, jurisdiction)
+        hard_flags.extend(clause_flags)
+        warnings_list.extend(clause_warnings)
 
         nda_flag = self._check_nda_terms(contract_data)
         if nda_flag:
             hard_flags.append(nda_flag)
 
-        if hard_flags:
-            details: Dict[str, Any] = {"flags": hard_flags}
-            if warnings_list:
-                details["warnings"] = warnings_list
-            return self.fail_result("; ".join(hard_flags), details=details)
-
-        if warnings_list:
-            return self.warn_result(
-                "; ".join(warnings_list), details={"warnings": warnings_list}
-            )
-
-        return self.pass_result()
+        return hard_flags, warnings_list, engine_failed
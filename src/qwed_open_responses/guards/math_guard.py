@@ -6,6 +6,7 @@ Uses deterministic verification (when possible) to catch calculation errors.
 
 from typing import Any, Dict, Optional, List
 from .base import BaseGuard, GuardResult
+import math
 import re
 
 
@@ -111,23 +112,30 @@ class MathGuard(BaseGuard):
         for total_field, components, op in patterns:
             if total_field in data:
                 expected_total = data[total_field]
-                calculated = 0.0
+                terms: List[float] = []
 
                 all_components_present = True
                 for comp in components:
                     if comp.startswith("-"):
                         field = comp[1:]
                         if field in data:
-                            calculated -= float(data[field])
+                            terms.append(-float(data[field]))
                         else:
                             all_components_present = False
                     else:
                         if comp in data:
-                            calculated += float(data[comp])
+                            terms.append(float(data[comp]))
                         else:
                             all_components_present = False
 
                 if all_components_present:
+                    # Exact summation keeps rounding error out of the tolerance
+                    try:
+                        calculated = math.fsum(terms)
+                    except (OverflowError, ValueError):
+                        # fsum rejects overflow and inf - inf; a plain sum
+                        # gives inf/nan and is compared as before
+                        calculated = sum(terms)
                     if abs(calculated - expected_total) > self.tolerance:
                         errors.append(
                             f"{total_field} mismatch: expected {expected_total}, "
@@ -6,8 +6,14 @@ Combines multiple safety checks into a single guard.
 
 from typing import Any, Dict, Optional, List, Set
 from .base import BaseGuard, GuardResult
+from bisect import bisect_right
 import re
 
+# Joins batch contents. Built-in matches may run into the separator but never
+# into the next document: \s stops at the NUL, and . or \S stop at the newline
+# after it. A spanning match only flags extra documents for a rescan.
+_BATCH_SEPARATOR = "\n\0\n"
+
 
 class SafetyGuard(BaseGuard):
     """
@@ -95,20 +101,85 @@ class SafetyGuard(BaseGuard):
         self.max_tokens = max_tokens
         self.custom_patterns = [re.compile(p, re.I) for p in (custom_patterns or [])]
 
+        # Compile built-in patterns once; the combined alternations let clean
+        # content be rejected in a single pass before per-pattern attribution
+        self._pii_res = {k: re.compile(p, re.I) for k, p in self.PII_PATTERNS.items()}
+        self._injection_res = [re.compile(p, re.I) for p in self.INJECTION_PATTERNS]
+        self._injection_re = self._compile_alternation(self.INJECTION_PATTERNS)
+        self._harmful_res = [re.compile(p, re.I) for p in self.HARMFUL_PATTERNS]
+        self._harmful_re = self._compile_alternation(self.HARMFUL_PATTERNS)
+
+    @staticmethod
+    def _compile_alternation(patterns: List[str]) -> "re.Pattern[str]":
+        """Compile patterns into a single case-insensitive alternation."""
+        return re.compile("|".join(f"(?:{p})" for p in patterns), re.I)
+
     def check(
         self,
         response: Dict[str, Any],
         context: Optional[Dict[str, Any]] = None,
     ) -> GuardResult:
         """Run all safety checks."""
-
         content = self._extract_content(response)
-        context = context or {}
+        return self._evaluate(response, content, context or {}, scan_text=True)
 
+    def check_batch(
+        self,
+        responses: List[Dict[str, Any]],
+        context: Optional[Dict[str, Any]] = None,
+    ) -> List[GuardResult]:
+        """Scan the batch as one corpus; only responses with hits are rescanned."""
+        context = context or {}
+        contents = [self._extract_content(r) for r in responses]
+        flagged = self._flag_batch(contents)
+        return [
+            self._evaluate(response, content, context, scan_text=i in flagged)
+            for i, (response, content) in enumerate(zip(responses, contents))
+        ]
+
+    def _flag_batch(self, contents: List[str]) -> Set[int]:
+        """Return indices of contents touched by any built-in pattern match."""
+        scanners = []
+        if self.check_pii:
+            scanners.extend(
+                pattern
+                for pii_type, pattern in self._pii_res.items()
+                if pii_type not in self.pii_allow_list
+            )
+        if self.check_injection:
+            scanners.append(self._injection_re)
+        if self.check_harmful:
+            scanners.append(self._harmful_re)
+        if not scanners:
+            return set()
+
+        starts = []
+        offset = 0
+        for content in contents:
+            starts.append(offset)
+            offset += len(content) + len(_BATCH_SEPARATOR)
+        corpus = _BATCH_SEPARATOR.join(contents)
+
+        flagged: Set[int] = set()
+        for scanner in scanners:
+            for match in scanner.finditer(corpus):
+                first = bisect_right(starts, match.start()) - 1
+                last = bisect_right(starts, max(match.end() - 1, match.start())) - 1
+                flagged.update(range(first, last + 1))
+        return flagged
+
+    def _evaluate(
+        self,
+        response: Dict[str, Any],
+        content: str,
+        context: Dict[str, Any],
+        scan_text: bool,
+    ) -> GuardResult:
+        """Collect issues; scan_text=False skips the built-in text patterns."""
         issues: List[Dict] = []
 
         # PII check
-        if self.check_pii:
+        if scan_text and self.check_pii:
             pii_found = self._check_pii(content)
             if pii_found:
                 issues.append(
@@ -120,7 +191,7 @@ class SafetyGuard(BaseGuard):
                 )
 
         # Injection check
-        if self.check_injection:
+        if scan_text and self.check_injection:
             injections = self._check_injection(content)
             if injections:
                 issues.append(
@@ -132,7 +203,7 @@ class SafetyGuard(BaseGuard):
                 )
 
         # Harmful content check
-        if self.check_harmful:
+        if scan_text and self.check_harmful:
             harmful = self._check_harmful(content)
             if harmful:
                 issues.append(
@@ -206,31 +277,37 @@ class SafetyGuard(BaseGuard):
         """Check for PII in content."""
         found = []
 
-        for pii_type, pattern in self.PII_PATTERNS.items():
+        for pii_type, pattern in self._pii_res.items():
             if pii_type in self.pii_allow_list:
                 continue
-            if re.search(pattern, content, re.I):
+            if pattern.search(content):
                 found.append(pii_type)
 
         return found
 
     def _check_injection(self, content: str) -> List[str]:
         """Check for prompt injection patterns."""
+        if not self._injection_re.search(content):
+            return []
+
         found = []
 
-        for pattern in self.INJECTION_PATTERNS:
-            if re.search(pattern, content, re.I):
-                found.append(pattern)
+        for pattern in self._injection_res:
+            if pattern.search(content):
+                found.append(pattern.pattern)
 
         return found
 
     def _check_harmful(self, content: str) -> List[str]:
         """Check for harmful content patterns."""
+        if not self._harmful_re.search(content):
+            return []
+
         found = []
 
-        for pattern in self.HARMFUL_PATTERNS:
-            if re.search(pattern, content, re.I):
-                found.append(pattern)
+        for pattern in self._harmful_res:
+            if pattern.search(content):
+                found.append(pattern.pattern)
 
         return found
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 from .base import BaseGuard, GuardResult
 
 
@@ -19,6 +19,17 @@ class TaxGuard(BaseGuard):
                 "qwed-tax is required. Install with: pip install qwed-open-responses[tax]"
             ) from err
 
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], GuardResult]] = {
+            "process_payroll": self._verify_payroll,
+            "send_international_wire": self._verify_international_wire,
+            "calculate_crypto_tax": self._verify_crypto_tax,
+        }
+
+        # Jurisdiction guards are imported and built on first use, then reused
+        self._payroll_guard: Any = None
+        self._remittance_guard: Any = None
+        self._crypto_guard: Any = None
+
     def check(
         self, response: Dict[str, Any], context: dict[str, Any] | None = None
     ) -> GuardResult:
@@ -48,13 +59,28 @@ class TaxGuard(BaseGuard):
     ) -> GuardResult:
         if not isinstance(arguments, dict):
             return self.fail_result("Invalid arguments: expected object")
-        if tool_name == "process_payroll":
-            return self._verify_payroll(arguments)
-        if tool_name == "send_international_wire":
-            return self._verify_international_wire(arguments)
-        if tool_name == "calculate_crypto_tax":
-            return self._verify_crypto_tax(arguments)
-        return self.fail_result(f"No tax guard for tool: {tool_name}")
+        handler = self._handlers.get(tool_name) if isinstance(tool_name, str) else None
+        if handler is None:
+            return self.fail_result(f"No tax guard for tool: {tool_name}")
+        return handler(arguments)
+
+    def _load_payroll_guard(self) -> Any:
+        from qwed_tax.jurisdictions.us.payroll_guard import PayrollGuard
+
+        self._payroll_guard = PayrollGuard()
+        return self._payroll_guard
+
+    def _load_remittance_guard(self) -> Any:
+        from qwed_tax.guards.remittance_guard import RemittanceGuard
+
+        self._remittance_guard = RemittanceGuard()
+        return self._remittance_guard
+
+    def _load_crypto_guard(self) -> Any:
+        from qwed_tax.jurisdictions.india.guards.crypto_guard import CryptoTaxGuard
+
+        self._crypto_guard = CryptoTaxGuard()
+        return self._crypto_guard
 
     def _verify_payroll(self, arguments: Dict[str, Any]) -> GuardResult:
         if not isinstance(arguments, dict):
@@ -67,9 +93,7 @@ class TaxGuard(BaseGuard):
                 f"Missing required payroll fields: {', '.join(missing)}"
             )
 
-        from qwed_tax.jurisdictions.us.payroll_guard import PayrollGuard
-
-        guard = PayrollGuard()
+        guard = self._payroll_guard or self._load_payroll_guard()
         result = guard.verify_fica_tax(
             gross_ytd=arguments["gross_ytd"],
             current=arguments.get("current") or 0,
@@ -78,9 +102,7 @@ class TaxGuard(BaseGuard):
         return self._check_result(result, "FICA tax verification failed")
 
     def _verify_international_wire(self, arguments: Dict[str, Any]) -> GuardResult:
-        from qwed_tax.guards.remittance_guard import RemittanceGuard
-
-        guard = RemittanceGuard()
+        guard = self._remittance_guard or self._load_remittance_guard()
         result = guard.verify_lrs_limit(
             amount_usd=arguments.get("amount_usd") or 0,
             purpose=arguments.get("purpose") or "",
@@ -89,9 +111,7 @@ class TaxGuard(BaseGuard):
         return self._check_result(result, "LRS limit exceeded")
 
     def _verify_crypto_tax(self, arguments: Dict[str, Any]) -> GuardResult:
-        from qwed_tax.jurisdictions.india.guards.crypto_guard import CryptoTaxGuard
-
-        guard = CryptoTaxGuard()
+        guard = self._crypto_guard or self._load_crypto_guard()
         result = guard.verify_set_off(
             losses=arguments.get("losses") or {},
             gains=arguments.get("gains") or {},
@@ -4,7 +4,7 @@ LlamaIndex Integration for QWED Open Responses.
 Provides callback handlers to verify query engine outputs.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from ..core import ResponseVerifier, VerificationResult
 from ..guards.base import BaseGuard
 
@@ -20,6 +20,18 @@ except ImportError:
     CBEventType = None
 
 
+def _response_text(response: Any) -> str:
+    """Return the text of a synthesized response, skipping __str__ when possible."""
+    if isinstance(response, str):
+        return response
+    # Response.response / StreamingResponse.response_txt already hold the text
+    for attr in ("response", "response_txt"):
+        text = getattr(response, attr, None)
+        if isinstance(text, str) and text:
+            return text
+    return str(response)
+
+
 class QWEDLlamaIndexHandler(BaseCallbackHandler if HAS_LLAMAINDEX else object):
     """
     LlamaIndex callback handler that verifies outputs.
@@ -43,6 +55,7 @@ class QWEDLlamaIndexHandler(BaseCallbackHandler if HAS_LLAMAINDEX else object):
         verify_retrieval: bool = True,
         verify_synthesis: bool = True,
         verbose: bool = False,
+        keep_history: bool = True,
     ):
         """
         Initialize the handler.
@@ -53,6 +66,9 @@ class QWEDLlamaIndexHandler(BaseCallbackHandler if HAS_LLAMAINDEX else object):
             verify_retrieval: Verify retrieved nodes
             verify_synthesis: Verify synthesized responses
             verbose: Print verification results
+            keep_history: Store every VerificationResult in
+                verification_history; when False only pass/fail counts are
+                kept for the summary
         """
         if not HAS_LLAMAINDEX:
             raise ImportError(
@@ -70,9 +86,19 @@ class QWEDLlamaIndexHandler(BaseCallbackHandler if HAS_LLAMAINDEX else object):
         self.verify_retrieval = verify_retrieval
         self.verify_synthesis = verify_synthesis
         self.verbose = verbose
+        self.keep_history = keep_history
 
-        # Track verification history
+        # Track verification history; counters cover results not stored
         self.verification_history: List[VerificationResult] = []
+        self._unstored_total = 0
+        self._unstored_passed = 0
+
+        # Event handlers, built once so each callback is a single lookup
+        self._dispatch: Dict[Any, Callable[[Dict[str, Any]], None]] = {
+            CBEventType.RETRIEVE: self._handle_retrieve,
+            CBEventType.SYNTHESIZE: self._handle_synthesize,
+            CBEventType.FUNCTION_CALL: self._handle_function_call,
+        }
 
     def on_event_start(
         self,
@@ -93,58 +119,75 @@ class QWEDLlamaIndexHandler(BaseCallbackHandler if HAS_LLAMAINDEX else object):
         **kwargs,
     ) -> None:
         """Called when event ends - verify output."""
+        if not payload:
+            return
+        handler = self._dispatch.get(event_type)
+        if handler is not None:
+            handler(payload)
 
-        if payload is None:
+    def _handle_retrieve(self, payload: Dict[str, Any]) -> None:
+        """Verify retrieved nodes."""
+        if not self.verify_retrieval:
             return
+        nodes = payload.get(EventPayload.NODES)
+        if nodes:
+            self._verify_nodes(nodes)
 
-        # Verify retrieval
-        if self.verify_retrieval and event_type == CBEventType.RETRIEVE:
-            nodes = payload.get(EventPayload.NODES, [])
-            for node in nodes:
-                self._verify_node(node)
-
-        # Verify synthesis/LLM response
-        if self.verify_synthesis and event_type == CBEventType.SYNTHESIZE:
-            response = payload.get(EventPayload.RESPONSE)
-            if response:
-                self._verify_response(response)
-
-        # Verify function/tool calls
-        if event_type == CBEventType.FUNCTION_CALL:
-            function_call = payload.get(EventPayload.FUNCTION_CALL)
-            if function_call:
-                self._verify_function_call(function_call)
-
-    def _verify_node(self, node: Any) -> None:
-        """Verify a retrieved node."""
-        node_dict = {
+    def _handle_synthesize(self, payload: Dict[str, Any]) -> None:
+        """Verify a synthesized/LLM response."""
+        if not self.verify_synthesis:
+            return
+        response = payload.get(EventPayload.RESPONSE)
+        if response:
+            self._verify_response(response)
+
+    def _handle_function_call(self, payload: Dict[str, Any]) -> None:
+        """Verify a function/tool call."""
+        function_call = payload.get(EventPayload.FUNCTION_CALL)
+        if function_call:
+            self._verify_function_call(function_call)
+
+    def _node_dict(self, node: Any) -> Dict[str, Any]:
+        """Build the verification payload for a retrieved node."""
+        # Only stringify nodes that lack a text attribute
+        try:
+            content = node.text
+        except AttributeError:
+            content = str(node)
+        return {
             "type": "retrieval_node",
-            "content": getattr(node, "text", str(node)),
+            "content": content,
             "metadata": getattr(node, "metadata", {}),
         }
 
-        result = self.verifier.verify(node_dict)
-        self.verification_history.append(result)
+    def _verify_nodes(self, nodes: List[Any]) -> None:
+        """Verify all retrieved nodes in one batch."""
+        results = self.verifier.verify_batch([self._node_dict(n) for n in nodes])
+        for result in results:
+            self._record(result)
 
         if self.verbose:
-            print(f"[QWED] Retrieval node -> {result}")
-
-        if not result.verified and self.block_on_failure:
-            raise RetrievalBlocked(
-                f"Retrieved node blocked: {result.block_reason}",
-                node=node,
-                result=result,
-            )
+            for result in results:
+                print(f"[QWED] Retrieval node -> {result}")
+
+        if self.block_on_failure:
+            for node, result in zip(nodes, results):
+                if not result.verified:
+                    raise RetrievalBlocked(
+                        f"Retrieved node blocked: {result.block_reason}",
+                        node=node,
+                        result=result,
+                    )
 
     def _verify_response(self, response: Any) -> None:
         """Verify a synthesized response."""
         response_dict = {
             "type": "synthesis_response",
-            "content": str(response),
+            "content": _response_text(response),
         }
 
         result = self.verifier.verify(response_dict)
-        self.verification_history.append(result)
+        self._record(result)
 
         if self.verbose:
             print(f"[QWED] Synthesis response -> {result}")
@@ -165,7 +208,7 @@ class QWEDLlamaIndexHandler(BaseCallbackHandler if HAS_LLAMAINDEX else object):
         }
 
         result = self.verifier.verify(call_dict)
-        self.verification_history.append(result)
+        self._record(result)
 
         if self.verbose:
             tool_name = function_call.get("name", "unknown")
@@ -178,6 +221,21 @@ class QWEDLlamaIndexHandler(BaseCallbackHandler if HAS_LLAMAINDEX else object):
                 result=result,
             )
 
+    def _record(self, result: VerificationResult) -> None:
+        """Store the result, or only count it when history is disabled."""
+        if self.keep_history:
+            self.verification_history.append(result)
+            return
+        self._unstored_total += 1
+        if result.verified:
+            self._unstored_passed += 1
+
+    def reset(self) -> None:
+        """Clear verification history and summary counts."""
+        self.verification_history.clear()
+        self._unstored_total = 0
+        self._unstored_passed = 0
+
     def start_trace(self, trace_id: Optional[str] = None) -> None:
         """Start a new trace."""
         pass
@@ -192,8 +250,11 @@ class QWEDLlamaIndexHandler(BaseCallbackHandler if HAS_LLAMAINDEX else object):
 
     def get_verification_summary(self) -> Dict[str, Any]:
         """Get summary of all verifications."""
-        total = len(self.verification_history)
-        passed = sum(1 for r in self.verification_history if r.verified)
+        total = len(self.verification_history) + self._unstored_total
+        passed = (
+            sum(1 for r in self.verification_history if r.verified)
+            + self._unstored_passed
+        )
         failed = total - passed
 
         return {
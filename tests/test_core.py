@@ -95,6 +95,149 @@ class TestResponseVerifier:
 
         assert result.guards_passed == 1
 
+    def test_verify_batch_preserves_order(self):
+        """verify_batch returns one result per response, in order."""
+
+        class ContentGuard(BaseGuard):
+            name = "ContentGuard"
+
+            def check(self, response, context=None):
+                if response.get("content") == "bad":
+                    return self.fail_result("bad content")
+                return self.pass_result()
+
+        verifier = ResponseVerifier(default_guards=[MockPassGuard(), ContentGuard()])
+        results = verifier.verify_batch(
+            [{"content": "ok"}, {"content": "bad"}, {"content": "ok"}]
+        )
+
+        assert [r.verified for r in results] == [True, False, True]
+        assert results[1].blocked is True
+        assert results[1].block_reason == "bad content"
+
+    def test_verify_batch_isolates_guard_errors(self):
+        """A guard raising on one response only fails that response."""
+
+        class FragileGuard(BaseGuard):
+            name = "FragileGuard"
+
+            def check(self, response, context=None):
+                if "boom" in response:
+                    raise RuntimeError("boom")
+                return self.pass_result()
+
+        verifier = ResponseVerifier()
+        results = verifier.verify_batch(
+            [{"ok": 1}, {"boom": 1}], guards=[FragileGuard()]
+        )
+
+        assert results[0].verified is True
+        assert results[1].verified is False
+        assert "Guard error" in results[1].guard_results[0].message
+
+    def test_verify_batch_calls_check_once_per_response(self):
+        """A guard raising for one response is not re-run for the others."""
+        calls = []
+
+        class CountingGuard(BaseGuard):
+            name = "CountingGuard"
+
+            def check(self, response, context=None):
+                calls.append(response["id"])
+                if response["id"] == 1:
+                    raise RuntimeError("boom")
+                return self.pass_result()
+
+        verifier = ResponseVerifier()
+        results = verifier.verify_batch(
+            [{"id": 0}, {"id": 1}, {"id": 2}], guards=[CountingGuard()]
+        )
+
+        assert calls == [0, 1, 2]
+        assert [r.verified for r in results] == [True, False, True]
+
+    def test_verify_batch_wrong_result_count_falls_back(self):
+        """A check_batch returning too few results is re-run per response."""
+
+        class ShortBatchGuard(BaseGuard):
+            name = "ShortBatchGuard"
+
+            def check(self, response, context=None):
+                return self.fail_result("fails")
+
+            def check_batch(self, responses, context=None):
+                return [self.pass_result()]
+
+        verifier = ResponseVerifier()
+        results = verifier.verify_batch(
+            [{"a": 1}, {"b": 2}], guards=[ShortBatchGuard()]
+        )
+
+        assert [r.verified for r in results] == [False, False]
+        assert all(r.guards_failed == 1 for r in results)
+
+    def test_non_guard_result_is_guard_error(self):
+        """A guard returning a non-GuardResult fails instead of raising."""
+
+        class DictGuard(BaseGuard):
+            name = "DictGuard"
+
+            def check(self, response, context=None):
+                return {"passed": True}
+
+        verifier = ResponseVerifier()
+        result = verifier.verify({"test": "data"}, guards=[DictGuard()])
+        batch = verifier.verify_batch([{"a": 1}, {"b": 2}], guards=[DictGuard()])
+
+        assert result.verified is False
+        assert result.guards_failed == 1
+        assert "Guard error" in result.guard_results[0].message
+        assert [r.verified for r in batch] == [False, False]
+
+    def test_non_guard_result_from_check_batch_is_guard_error(self):
+        """check_batch overrides returning non-GuardResults fail per item."""
+
+        class BadBatchGuard(BaseGuard):
+            name = "BadBatchGuard"
+
+            def check(self, response, context=None):
+                return self.pass_result()
+
+            def check_batch(self, responses, context=None):
+                return [self.pass_result(), None]
+
+        verifier = ResponseVerifier()
+        results = verifier.verify_batch([{"a": 1}, {"b": 2}], guards=[BadBatchGuard()])
+
+        assert [r.verified for r in results] == [True, False]
+        assert "Guard error" in results[1].guard_results[0].message
+
+    def test_parallel_guards_run_concurrently(self):
+        """parallel=True runs guards at the same time, keeping result order."""
+        import threading
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        class BarrierGuard(BaseGuard):
+            name = "BarrierGuard"
+
+            def check(self, response, context=None):
+                barrier.wait()
+                return self.pass_result()
+
+        verifier = ResponseVerifier(parallel=True)
+        result = verifier.verify(
+            {"test": "data"}, guards=[BarrierGuard(), BarrierGuard(), MockFailGuard()]
+        )
+
+        assert result.guards_passed == 2
+        assert result.guards_failed == 1
+        assert [g.guard_name for g in result.guard_results] == [
+            "BarrierGuard",
+            "BarrierGuard",
+            "MockFailGuard",
+        ]
+
     def test_parse_string_json(self):
         """Test parsing JSON string."""
         verifier = ResponseVerifier()